@@ -35,16 +35,19 @@ def typename(type: type) -> str:
     return CONTENT_TYPE_NAMES[type.__name__]
 
 
-def _dget(d: dict, key: str, what: str, default_value: Optional[T], expected_type: Type[T]) -> T:
-    if default_value is None and key not in d:
-        raise ApiSpecError(f"{what}.{key} is mandatory, but is not set")
-    value = d.get(key, default_value)
+def check_value_type(value: Any, key: str, what: str, expected_type: Type[T]) -> T:
     if not isinstance(value, expected_type):
         raise ApiSpecError(
             f"{what}.{key} expected to be a {typename(expected_type)} but is {typename(type(value)) if value is not None else 'not set'}")
     return cast(T, value)
 
 
+def _dget(d: dict, key: str, what: str, default_value: Optional[T], expected_type: Type[T]) -> T:
+    if default_value is None and key not in d:
+        raise ApiSpecError(f"{what}.{key} is mandatory, but is not set")
+    return check_value_type(d.get(key, default_value), key, what, expected_type)
+
+
 def dget_dict(d: dict, key: str, what: str, default_value: Optional[dict] = None) -> dict:
     return _dget(d, key, what, default_value, dict)
 
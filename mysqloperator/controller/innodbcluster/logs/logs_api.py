@@ -9,7 +9,7 @@ from logging import Logger
 from ...api_utils import dget_dict, dget_str, dget_list, ApiSpecError
 from ...kubeutils import client as api_client
 from .logs_collector_fluentd_api import FluentdSpec
-from .logs_types_api import ServerLogType, GeneralLogSpec, ErrorLogSpec, SlowQueryLogSpec, MySQLLogSpecBase
+from .logs_types_api import ServerLogType, GeneralLogSpec, ErrorLogSpec, SlowQueryLogSpec, MySQLLogSpecBase, add_config_map_mounts_to_sts_spec
 #from ..cluster_api import AddToStsHandler
 
 lc_default_container_name = "logcollector"
@@ -122,9 +122,8 @@ class LogsSpec:
     def get_add_to_sts_cb(self) -> Optional['AddToStsHandler']:
         def cb(sts: Union[dict,api_client.V1StatefulSet], patcher: 'InnoDBClusterObjectModifier', logger: Logger) -> None:
             enabled = self.enabled
-            for logName in self.logs:
-                container_name = "mysql"
-                self.logs[logName].add_to_sts_spec(sts, patcher, container_name, self.cm_name, enabled, logger)
+            container_name = "mysql"
+            add_config_map_mounts_to_sts_spec(sts, patcher, list(self.logs.values()), container_name, self.cm_name, enabled, logger)
             self.collector.add_to_sts_spec(sts, patcher, self.logs, enabled, logger)
         return cb
 
@@ -12,6 +12,12 @@ from .logs_types_api import  ServerLogType, GeneralLogSpec, SlowQueryLogSpec, Er
 import yaml
 import os
 
+# Prefer the LibYAML bindings, the pure Python implementation is a lot slower
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 def get_volume_name(volume) -> Optional[str]:
     return volume.get('name') if type(volume) == dict else volume.name #V1Volume
@@ -283,21 +289,21 @@ class FluentdSpec:
                                          container_name: str,
                                          logger: Logger) -> None:
         if isinstance(sts, dict):
-            containers = sts["spec"]["template"]["spec"]["containers"]
-            sts["spec"]["template"]["spec"]["containers"] = [container for container in containers if get_container_name(container) != container_name]
+            pod_spec = sts["spec"]["template"]["spec"]
+            pod_spec["containers"] = [container for container in pod_spec["containers"] if get_container_name(container) != container_name]
         elif isinstance(sts, api_client.V1StatefulSet):
-            containers = sts.spec.template.spec.containers
-            sts.spec.template.spec.containers = [container for container in containers if get_container_name(container) != container_name]
+            pod_spec = sts.spec.template.spec
+            pod_spec.containers = [container for container in pod_spec.containers if get_container_name(container) != container_name]
 
     def _remove_volumes_from_sts_spec(self, sts: Union[dict, api_client.V1StatefulSet],
                                       logger: Logger) -> None:
         volume_name = self.fluentd_configmap_volume_mount_name
         if isinstance(sts, dict):
-            volumes = sts["spec"]["template"]["spec"]["volumes"]
-            sts["spec"]["template"]["spec"]["volumes"] = [volume for volume in volumes if get_volume_name(volume) != volume_name]
+            pod_spec = sts["spec"]["template"]["spec"]
+            pod_spec["volumes"] = [volume for volume in pod_spec["volumes"] if get_volume_name(volume) != volume_name]
         elif isinstance(sts, api_client.V1StatefulSet):
-            volumes = sts.spec.template.spec.volumes
-            sts.spec.template.spec.volumes = [volume for volume in volumes if get_volume_name(volume) != volume_name]
+            pod_spec = sts.spec.template.spec
+            pod_spec.volumes = [volume for volume in pod_spec.volumes if get_volume_name(volume) != volume_name]
 
     def remove_from_sts_spec(self, sts: Union[dict, api_client.V1StatefulSet],
                              container_name: str,
@@ -325,8 +331,8 @@ class FluentdSpec:
   securityContext:
     readOnlyRootFilesystem: false
   env:
-{utils.indent(yaml.dump(image_envs),2) if len(image_envs) else ""}
-{utils.indent(yaml.dump(envs_list),2) if len(envs_list) else ""}
+{utils.indent(yaml.dump(image_envs, Dumper=SafeDumper),2) if len(image_envs) else ""}
+{utils.indent(yaml.dump(envs_list, Dumper=SafeDumper),2) if len(envs_list) else ""}
   volumeMounts:
   - name: datadir
     mountPath: {self.fluentd_container_mysql_datadir_path}
@@ -337,12 +343,12 @@ class FluentdSpec:
 """
 
         if isinstance(sts, dict):
-            sts["spec"]["template"]["spec"]["containers"] += yaml.safe_load(patch)
+            sts["spec"]["template"]["spec"]["containers"] += yaml.load(patch, Loader=SafeLoader)
         elif isinstance(sts, api_client.V1StatefulSet):
+            pod_spec = sts.spec["template"]['spec']
             # first filter out our old logs container spec
-            containers = sts.spec["template"]['spec']['containers']
-            sts.spec["template"]['spec']['containers'] = [container for container in containers if get_container_name(container) != container_name]
-            sts.spec["template"]['spec']['containers'] += yaml.safe_load(patch)
+            pod_spec['containers'] = [container for container in pod_spec['containers'] if get_container_name(container) != container_name]
+            pod_spec['containers'] += yaml.load(patch, Loader=SafeLoader)
 
 
     def _add_volumes_to_sts_spec(self,
@@ -362,12 +368,13 @@ class FluentdSpec:
       path: {config_file_name}
 """
         if isinstance(sts, dict):
-            sts["spec"]["template"]["spec"]["volumes"] += yaml.safe_load(patch)
+            sts["spec"]["template"]["spec"]["volumes"] += yaml.load(patch, Loader=SafeLoader)
         elif isinstance(sts, api_client.V1StatefulSet):
-            logger.info(f"sts.spec.template.spec.volumes={sts.spec['template']['spec']['volumes']}")
+            pod_spec = sts.spec["template"]['spec']
+            logger.info(f"sts.spec.template.spec.volumes={pod_spec['volumes']}")
             # first filter out our old logs volumes spec
-            sts.spec["template"]['spec']['volumes'] = [volume for volume in sts.spec["template"]['spec']['volumes'] if volume and get_volume_name(volume) != volume_name]
-            sts.spec["template"]['spec']['volumes'] += yaml.safe_load(patch)
+            pod_spec['volumes'] = [volume for volume in pod_spec['volumes'] if volume and get_volume_name(volume) != volume_name]
+            pod_spec['volumes'] += yaml.load(patch, Loader=SafeLoader)
 
 
     def add_to_sts_spec(self,
@@ -4,13 +4,16 @@
 #
 
 from enum import Enum
-from typing import Optional, Union, List, Dict, Any
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Optional, Union, List, Dict, Any, Callable, Tuple
 from logging import Logger
-from ...api_utils import dget_bool, dget_int, ApiSpecError
+from ...api_utils import check_value_type, ApiSpecError
 from ...kubeutils import client as api_client
 from ... import utils
-import yaml
-from abc import ABC, abstractmethod
+
+# Marks a field missing from the spec, as None is a value the user may have set
+_MISSING = object()
 
 def snail_to_camel(s: str) -> str:
     if s.find("_") == -1:
@@ -40,6 +43,17 @@ def has_object_attr(obj: Union[Dict, api_client.V1Container, api_client.V1Volume
 def get_object_name(obj: Union[Dict, api_client.V1Container, api_client.V1Volume, api_client.V1ServicePort]) -> str:
     return get_object_attr(obj, "name")
 
+# The items of a single list are homogeneous: either all V1* objects, as fetched from K8s,
+# or all dicts, as produced by merge_patch_object(). Thus the type is checked once per
+# list instead of once per item, like get_object_name() does.
+def _name_getter(items: list) -> Callable[[Any], str]:
+    first = next((item for item in items if item), None)
+    return attrgetter("name") if first is not None and not isinstance(first, dict) else itemgetter("name")
+
+def _index_by_name(items: list) -> Dict[str, int]:
+    name_of = _name_getter(items)
+    return {name_of(item): idx for idx, item in enumerate(items) if item}
+
 
 # Replaces whole container in sts.spec.template.spec.containers
 def patch_sts_spec_template_complex_attribute(sts: Union[dict, api_client.V1StatefulSet], patcher: 'InnoDBClusterObjectModifier', patch: dict, attr: str, add: bool) -> None:
@@ -47,7 +61,7 @@ def patch_sts_spec_template_complex_attribute(sts: Union[dict, api_client.V1Stat
     attr_c = snail_to_camel(attr)
     if patch is None or len(patch[attr_c]) == 0:
         return
-    attr_names = [a["name"] for a in patch[attr_c]]
+    attr_names = {a["name"] for a in patch[attr_c]}
     #print(f"\npatch_sts_spec_template_complex_attribute: attr_names={attr_names}\n")
     if isinstance(sts, dict):
         # first filter out
@@ -56,20 +70,25 @@ def patch_sts_spec_template_complex_attribute(sts: Union[dict, api_client.V1Stat
         # This is at startup, when we create ourselves. V1StatefulSet is only when we fetch from the server.
         # For now when we create ourselves we don't use the patcher
         #print(f"\tpatch_sts_spec_template_complex_attribute Dict. Filtering out {attr_c}")
-        sts["spec"]["template"]["spec"][attr_c] = [a for a in sts["spec"]["template"]["spec"][attr_c] if a and get_object_name(a) not in attr_names]
+        pod_spec = sts["spec"]["template"]["spec"]
+        current_value = pod_spec[attr_c]
+        name_of = _name_getter(current_value)
+        pod_spec[attr_c] = [a for a in current_value if a and name_of(a) not in attr_names]
         if add:
             #print(f"STS is dict. Patching with {patch}")
             #patcher.patch_sts({"spec":{"template":{"spec": patch}}})
             #print(f"patch_sts_spec_template_complex_attribute: STS is Dict. Adding {attr_c} attribute by patching with {patch}\n")
-            utils.merge_patch_object(sts["spec"]["template"]["spec"], patch)
+            utils.merge_patch_object(pod_spec, patch)
     elif isinstance(sts, api_client.V1StatefulSet):
         # first filter out
         # attribute should be here snail case
         path = f"/spec/template/spec/{attr_c}"
         sts_path = patcher.get_sts_path(path)
-        cleaned_up_attr = [a for a in sts_path if a and get_object_name(a) not in attr_names]
+        name_of = _name_getter(sts_path)
+        cleaned_up_attr = [a for a in sts_path if a and name_of(a) not in attr_names]
         #print(f"\tcleaned_up_attr     = {cleaned_up_attr}\n")
-        if cleaned_up_attr != sts_path:
+        # Filtering only ever drops items, so comparing the lengths is enough
+        if len(cleaned_up_attr) != len(sts_path):
             patcher.patch_sts_overwrite(cleaned_up_attr, path)
         #sts.spec["template"]["spec"][attr_c] = [a for a in sts.spec["template"]["spec"][attr_c] if a and get_object_name(a) not in attr_names]
         if add:
@@ -84,45 +103,88 @@ def patch_sts_spec_template_complex_attribute(sts: Union[dict, api_client.V1Stat
 def patch_container_attribute(sts: Union[dict, api_client.V1StatefulSet], patcher: 'InnoDBClusterObjectModifier', patch: dict, attr: str, add: bool) -> None:
     #print(f"\npatch_container_attribute attr={attr} add={add} patch={patch}")
     attr_c = snail_to_camel(attr)
-    for container_idx in range(0, len(patch["containers"])):
-        container_name = patch["containers"][container_idx]["name"]
-        changed_obj_names = [ attr_v["name"] for attr_v in patch["containers"][container_idx][attr_c] ]
-        found = False
-        if isinstance(sts, dict):
-            #print("\npatch_container_attribute dict\n")
-            # first filter out
-            for container in sts["spec"]["template"]["spec"]["containers"]:
-                if get_object_name(container) == container_name:
-                    current_value = get_object_attr(container, attr) if has_object_attr(container, attr) else []
-                    #print(f"\t\t\t\tcurrent_value({container_name}.{attr})={current_value}")
-                    new_value = [v for v in current_value if (v and (get_object_name(v) not in changed_obj_names))]
-                    if add:
-                        new_value += patch["containers"][container_idx][attr_c]
-                    #print(f"\t\t\t\tnew_value({container_name}.{attr})={new_value}")
-                    set_object_attr(container, attr, new_value)
-                    found = True
-                    break
-            if found == False and add:
-                utils.merge_patch_object(sts["spec"]["template"]["spec"], patch)
-        elif isinstance(sts, api_client.V1StatefulSet):
-            #print("\npatch_container_attribute V1StatefulSet\n")
-            for container in sts.spec["template"]["spec"]["containers"]:
-                if get_object_name(container) == container_name:
-                    current_value = get_object_attr(container, attr) if has_object_attr(container, attr) else []
-                    #print(f"\t\t\t\tcurrent_value({container_name}.{attr})={current_value}")
-                    new_value = [v for v in current_value if (v and (get_object_name(v) not in changed_obj_names))]
-                    #print(f"\new_value={new_value}")
-                    if add:
-                        new_value += patch["containers"][container_idx][attr_c]
-                    #print(f"\t\t\t\tnew_value({container_name}.{attr})={new_value}")
-                    #print(f"\tset_object_attr={new_value}")
-                    set_object_attr(container, attr, new_value)
-                    found = True
-                    break
-            if found == False and add:
+    if isinstance(sts, dict):
+        pod_spec = sts["spec"]["template"]["spec"]
+    elif isinstance(sts, api_client.V1StatefulSet):
+        pod_spec = sts.spec["template"]["spec"]
+    else:
+        return
+    containers = pod_spec["containers"]
+    # Index the containers once instead of rescanning them for every patched container
+    containers_index = _index_by_name(containers)
+    for container_patch in patch["containers"]:
+        container_idx = containers_index.get(container_patch["name"])
+        if container_idx is not None:
+            container = containers[container_idx]
+            changed_obj_names = {attr_v["name"] for attr_v in container_patch[attr_c]}
+            current_value = get_object_attr(container, attr) if has_object_attr(container, attr) else []
+            #print(f"\t\t\t\tcurrent_value({container_patch['name']}.{attr})={current_value}")
+            name_of = _name_getter(current_value)
+            new_value = [v for v in current_value if (v and (name_of(v) not in changed_obj_names))]
+            if add:
+                new_value += container_patch[attr_c]
+            #print(f"\t\t\t\tnew_value({container_patch['name']}.{attr})={new_value}")
+            set_object_attr(container, attr, new_value)
+        elif add:
+            if isinstance(sts, dict):
+                utils.merge_patch_object(pod_spec, patch)
+            else:
                 #print(f"patch_container_attribute: STS is V1StatefulSet. Patching with {patch}")
                 patcher.patch_sts({"spec":{"template":{"spec": patch}}})
-                #utils.merge_patch_object(sts.spec["template"]["spec"]["containers"], patch)
+
+
+_MYCNF_HEADER = "# Generated by MySQL Operator for Kubernetes\n[mysqld]"
+
+# The rendered .cnf bodies depend only on a handful of scalar fields, which rarely
+# change between reconciles, so they are memoized. typed=True keeps e.g. 1 and 1.0
+# in different cache entries, as they render differently.
+@lru_cache(maxsize=128, typed=True)
+def _render_general_log_cnf(enabled: Optional[bool], fileName: str) -> str:
+    lines = [
+        _MYCNF_HEADER,
+        f"general_log={1 if enabled else 0}",
+    ]
+
+    if enabled:
+        lines.append(f"general_log_file={fileName}")
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _render_error_log_cnf(verbosity: int, collect: bool, error_log_name: str) -> str:
+    lines = [
+        _MYCNF_HEADER,
+        f"log_error_verbosity={verbosity}",
+    ]
+
+    if collect:
+        lines.append(f"log_error='{error_log_name}'")
+        lines.append("log_error_services='log_sink_json'")
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _render_slow_query_log_cnf(enabled: Optional[bool], fileName: str, longQueryTime: Optional[Union[float, int]]) -> str:
+    lines = [
+        _MYCNF_HEADER,
+        f"slow_query_log={1 if enabled else 0}",
+    ]
+
+    if enabled:
+        lines.append(f"slow_query_log_file='{fileName}'")
+        lines.append("log_slow_admin_statements=1")
+
+        if longQueryTime:
+            lines.append(f"long_query_time={longQueryTime}")
+
+    return "\n".join(lines)
+
+
+def _check_collect_requires_enabled(prefix: Optional[str], collect: bool, enabled: Optional[bool]) -> None:
+    if collect and not enabled:
+        raise ApiSpecError(f"{prefix}.collect is enabled while {prefix}.enabled is not")
 
 
 # Must correspond to the names in the CRD
@@ -131,68 +193,73 @@ class ServerLogType(Enum):
     GENERAL = "general"
     SLOW_QUERY = "slowQuery"
 
-class ConfigMapMountBase(ABC):
+# The classes below declare __slots__ as their attributes are read on every reconcile.
+# A subclass without __slots__ (like MetricsConfigMap) simply gets a __dict__ again.
+# Values which are never set by parse() are class attributes instead of slots.
+class ConfigMapMountBase:
+    __slots__ = ('volume_mount_name', 'config_file_name', 'config_file_mount_path', '_mount_path',
+                 '_volume_mount_item', '_container_volume_mount')
+
     def __init__(self, volume_mount_name: str, config_file_name: str, config_file_mount_path: str):
         super().__init__()
         self.volume_mount_name = volume_mount_name
         self.config_file_name = config_file_name
         self.config_file_mount_path = config_file_mount_path
+        self._mount_path = f"{config_file_mount_path}/{config_file_name}"
+        # Constant parts of the patch built in build_patch(). They end up in the STS,
+        # thus they are always copied and never put in a patch as they are.
+        self._volume_mount_item = {
+            "key" : config_file_name,
+            "path": config_file_name
+        }
+        self._container_volume_mount = {
+            "name" : volume_mount_name,
+            "mountPath": self._mount_path,
+            "subPath": config_file_name
+        }
 
-    @abstractmethod
-    def parse(self, spec: dict, prefix: str, logger: Logger) -> None:
-        ...
+    def _get_volume(self, cm_name: str) -> dict:
+        return {
+            "name": self.volume_mount_name,
+            "configMap": {
+                "name" : cm_name,
+                "defaultMode": 0o644,
+                "items": [{**self._volume_mount_item}]
+            }
+        }
 
-    @abstractmethod
-    def validate(self) -> None:
-        ...
+    def _get_volume_mount(self) -> dict:
+        return {**self._container_volume_mount}
 
+    # Returns the containers and volumes fragments, which add_to_sts_spec() patches into the STS
+    def build_patch(self, container_name: str, cm_name: str) -> dict:
+        return {
+            "containers" : [
+                {
+                    "name": container_name,
+                    "volumeMounts": [self._get_volume_mount()]
+                }
+            ],
+            "volumes" : [self._get_volume(cm_name)]
+        }
+
+    # patch is what build_patch() returns, only its volumes are patched in here
     def _add_volumes_to_sts_spec(self,
                                  sts: Union[dict, api_client.V1StatefulSet],
                                  patcher: 'InnoDBClusterObjectModifier',
-                                 cm_name: str,
+                                 patch: dict,
                                  add: bool,
                                  logger: Logger) -> None:
-        patch = {
-            "volumes" : [
-                {
-                    "name": self.volume_mount_name,
-                    "configMap": {
-                        "name" : cm_name,
-                        "defaultMode": 0o644,
-                        "items": [
-                            {
-                                "key" : self.config_file_name,
-                                "path": self.config_file_name
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
-        patch_sts_spec_template_complex_attribute(sts, patcher, patch, "volumes", add)
-
+        patch_sts_spec_template_complex_attribute(sts, patcher, {"volumes": patch["volumes"]}, "volumes", add)
 
+    # patch is what build_patch() returns, only its containers are patched in here
     def _add_containers_to_sts_spec(self,
                                     sts: Union[dict, api_client.V1StatefulSet],
                                     patcher: 'InnoDBClusterObjectModifier',
-                                    container_name: str,
+                                    patch: dict,
                                     add: bool,
                                     logger: Logger) -> None:
-        patch = {
-            "containers" : [
-                {
-                    "name": container_name,
-                    "volumeMounts": [
-                        {
-                            "name" : self.volume_mount_name,
-                            "mountPath": f"{self.config_file_mount_path}/{self.config_file_name}",
-                            "subPath": self.config_file_name
-                        }
-                    ]
-                }
-            ]
-        }
-        patch_container_attribute(sts, patcher, patch, "volume_mounts", add)
+        patch_container_attribute(sts, patcher, {"containers": patch["containers"]}, "volume_mounts", add)
 
     def add_to_sts_spec(self,
                         sts: Union[dict, api_client.V1StatefulSet],
@@ -201,84 +268,158 @@ class ConfigMapMountBase(ABC):
                         cm_name: str,
                         add: bool,
                         logger: Logger) -> None:
-        self._add_containers_to_sts_spec(sts, patcher, container_name, add, logger)
-        self._add_volumes_to_sts_spec(sts, patcher, cm_name, add, logger)
+        if self.is_sts_spec_up_to_date(sts, patcher, container_name, cm_name, add):
+            return
+        patch = self.build_patch(container_name, cm_name)
+        self._add_containers_to_sts_spec(sts, patcher, patch, add, logger)
+        self._add_volumes_to_sts_spec(sts, patcher, patch, add, logger)
+
+    # Checks whether the STS already has the volume and the volume mount exactly as they would
+    # be patched in (or has none of them, when removing). Then patching can be skipped, which
+    # otherwise marks the STS as changed on every reconcile.
+    def is_sts_spec_up_to_date(self,
+                               sts: Union[dict, api_client.V1StatefulSet],
+                               patcher: 'InnoDBClusterObjectModifier',
+                               container_name: str,
+                               cm_name: str,
+                               add: bool) -> bool:
+        if isinstance(sts, dict):
+            pod_spec = sts["spec"]["template"]["spec"]
+        elif isinstance(sts, api_client.V1StatefulSet):
+            # sts.spec may lag behind patches which are accumulated in the patcher
+            pod_spec = patcher.get_sts_path("/spec/template/spec")
+        else:
+            return False
+
+        def find_named(items: Optional[list], name: str) -> Optional[List[dict]]:
+            # None means "can't tell" for objects which aren't dicts
+            if any(item and not isinstance(item, dict) for item in items or []):
+                return None
+            return [item for item in items or [] if item and item.get("name") == name]
+
+        containers = find_named(pod_spec.get("containers"), container_name)
+        volumes = find_named(pod_spec.get("volumes"), self.volume_mount_name)
+        if containers is None or volumes is None or len(containers) > 1:
+            return False
+        mounts = find_named(containers[0].get("volumeMounts"), self.volume_mount_name) if containers else []
+        if mounts is None:
+            return False
+
+        if not add:
+            return not volumes and not mounts
+
+        return volumes == [self._get_volume(cm_name)] and mounts == [self._container_volume_mount]
+
+
+# Has the same effect as calling add_to_sts_spec() of every mount, but merges what needs
+# patching into one volumes and one volume mounts patch, instead of patching once per mount
+def add_config_map_mounts_to_sts_spec(sts: Union[dict, api_client.V1StatefulSet],
+                                      patcher: 'InnoDBClusterObjectModifier',
+                                      mounts: List[ConfigMapMountBase],
+                                      container_name: str,
+                                      cm_name: str,
+                                      add: bool,
+                                      logger: Logger) -> None:
+    patch = {}
+    for mount in mounts:
+        if not mount.is_sts_spec_up_to_date(sts, patcher, container_name, cm_name, add):
+            utils.merge_patch_object(patch, mount.build_patch(container_name, cm_name))
+
+    if not patch:
+        return
+
+    patch_container_attribute(sts, patcher, {"containers": patch["containers"]}, "volume_mounts", add)
+    patch_sts_spec_template_complex_attribute(sts, patcher, {"volumes": patch["volumes"]}, "volumes", add)
 
 
 class MySQLLogSpecBase(ConfigMapMountBase):
-    def __init__(self, volume_mount_name: str, config_file_name: str, config_file_mount_path: str):
-        super().__init__(volume_mount_name, config_file_name, config_file_mount_path)
+    __slots__ = ('_prefix', '_dirty', '_cached_cm')
 
-    @abstractmethod
-    def get_cm_data(self, logger: Logger) -> Dict[str, str]:
-        ...
+    # (field in the spec, attribute, expected type) for every field parse() reads.
+    # An expected type of None takes the value as it is.
+    _FIELDS: Tuple[Tuple[str, str, Optional[type]], ...] = ()
 
-class GeneralLogSpec(MySQLLogSpecBase):
-    def __init__(self):
-        super().__init__("general-log-config", "general-log.cnf", "/etc/my.cnf.d")
-        self._enabled : Optional[bool] = None
-        self.collect: bool = False
-        self.fileName: str = "general_query.log"
+    def __init__(self, volume_mount_name: str, config_file_name: str, config_file_mount_path: str):
+        super().__init__(volume_mount_name, config_file_name, config_file_mount_path)
         self._prefix: Optional[str] = None
+        # Set when parse() changed a field. The defaults are valid, so without changes there
+        # is nothing to validate.
+        self._dirty: bool = False
+        # The rendered .cnf of get_cm_data(). The fields it depends on only change in parse(),
+        # which drops it, so no key is needed
+        self._cached_cm: Optional[str] = None
+
+    def _invalidate_cm_cache(self) -> None:
+        self._cached_cm = None
 
     def parse(self, spec: dict, prefix: str, logger: Logger) -> None:
         if not spec:
             return
 
+        self._invalidate_cm_cache()
         self._prefix = prefix
 
-        field = "enabled"
-        if field in spec:
-            self._enabled = dget_bool(spec, field, prefix)
-
-        field = "collect"
-        if field in spec:
-            self.collect = dget_bool(spec, field, prefix)
+        for field, attr, expected_type in self._FIELDS:
+            value = spec.get(field, _MISSING)
+            if value is not _MISSING:
+                if expected_type is not None:
+                    value = check_value_type(value, field, prefix, expected_type)
+                setattr(self, attr, value)
+                self._dirty = True
 
     def validate(self) -> None:
-        if self.collect and not self.enabled:
-            raise ApiSpecError(f"{self._prefix}.collect is enabled while {self._prefix}.enabled is not")
+        if not self._dirty:
+            return
+        self._validate()
+        self._dirty = False
+
+class GeneralLogSpec(MySQLLogSpecBase):
+    __slots__ = ('_enabled', 'collect')
+
+    _FIELDS = (
+        ("enabled", "_enabled", bool),
+        ("collect", "collect", bool),
+    )
+
+    fileName: str = "general_query.log"
+
+    def __init__(self):
+        super().__init__("general-log-config", "general-log.cnf", "/etc/my.cnf.d")
+        self._enabled : Optional[bool] = None
+        self.collect: bool = False
+
+    def _validate(self) -> None:
+        _check_collect_requires_enabled(self._prefix, self.collect, self.enabled)
 
     @property
     def enabled(self) -> Optional[bool]:
         return self._enabled
 
     def get_cm_data(self, logger: Logger) -> Dict[str, str]:
-        mycnf = f"""# Generated by MySQL Operator for Kubernetes
-[mysqld]
-general_log={1 if self.enabled else 0}"""
-
-        if self.enabled:
-            mycnf += f"""
-general_log_file={self.fileName}"""
+        if self._cached_cm is None:
+            self._cached_cm = _render_general_log_cnf(self.enabled, self.fileName)
 
         return {
-            self.config_file_name : mycnf
+            self.config_file_name : self._cached_cm
         }
 
 
 class ErrorLogSpec(MySQLLogSpecBase):
+    __slots__ = ('collect', 'verbosity')
+
+    _FIELDS = (
+        ("verbosity", "verbosity", int),
+        ("collect", "collect", bool),
+    )
+
+    error_log_name: str = "error.log"
+
     def __init__(self):
         super().__init__("error-log-config", "error-log.cnf", "/etc/my.cnf.d")
         self.collect: bool = False
         self.verbosity: int = 3
-        self.error_log_name: str = "error.log"
-        self._prefix: Optional[str] = None
-
-    def parse(self, spec: dict, prefix: str, logger: Logger) -> None:
-        if not spec:
-            return
-        self._prefix = prefix
-
-        field = "verbosity"
-        if field in spec:
-            self.verbosity = dget_int(spec, field, prefix)
 
-        field = "collect"
-        if field in spec:
-            self.collect = dget_bool(spec, field, prefix)
-
-    def validate(self) -> None:
+    def _validate(self) -> None:
         if self.verbosity < 1 or self.verbosity > 3:
             raise ApiSpecError(f"{self._prefix}.verbosity must be between 1 and 3")
 
@@ -287,74 +428,48 @@ class ErrorLogSpec(MySQLLogSpecBase):
         return True
 
     def get_cm_data(self, logger: Logger) -> Dict[str, str]:
-        mycnf = f"""# Generated by MySQL Operator for Kubernetes
-[mysqld]
-log_error_verbosity={self.verbosity}"""
-
-        if self.collect:
-            mycnf += f"""
-log_error='{(self.error_log_name)}'
-log_error_services='log_sink_json'"""
+        if self._cached_cm is None:
+            self._cached_cm = _render_error_log_cnf(self.verbosity, self.collect, self.error_log_name)
+
         return {
-            self.config_file_name : mycnf
+            self.config_file_name : self._cached_cm
         }
 
 
 class SlowQueryLogSpec(MySQLLogSpecBase):
+    __slots__ = ('_enabled', 'longQueryTime', 'collect')
+
+    _FIELDS = (
+        ("enabled", "_enabled", bool),
+        # There is no dget_int_or_float() and longQueryTime is a "number" and not a "string" in the CRD,
+        # thus the value is taken as it is. The default value comes from the CRD anyway
+        ("longQueryTime", "longQueryTime", None),
+        ("collect", "collect", bool),
+    )
+
+    fileName: str = "slow_query.log"
+
     def __init__(self):
         super().__init__("slow-query-log-config", "slow-query-log.cnf", "/etc/my.cnf.d")
         self._enabled: Optional[bool] = None
         self.longQueryTime: Optional[Union[float, int]] = None
         self.collect: bool = False
-        self.fileName: str = "slow_query.log"
-        self._prefix: Optional[str] = None
-
-    def parse(self, spec: dict, prefix: str, logger: Logger) -> None:
-        if not spec:
-            return
-
-        self._prefix = prefix
 
-        field = "enabled"
-        if field in spec:
-            self._enabled = dget_bool(spec, field, prefix)
-
-        field ="longQueryTime"
-        if field in spec:
-            # dget_float() doesn't like when an integer is passed and there is no dget_int_or_float
-            # dget_str() doesn't like to read an integer and longQueryTime is "number" and not a "string" in the CRD
-            # Thus direct read without going over dget_ . We have checked that it is there and the default value
-            # comes from the CRD anyway
-            self.longQueryTime = spec[field]
-
-        field = "collect"
-        if field in spec:
-            self.collect = dget_bool(spec, field, prefix)
-
-    def validate(self) -> None:
-        if (isinstance(self.longQueryTime, int) or isinstance(self.longQueryTime, float)) and self.longQueryTime < 0:
+    def _validate(self) -> None:
+        lqt = self.longQueryTime
+        if isinstance(lqt, (int, float)) and lqt < 0:
             raise ApiSpecError(f"{self._prefix}.longQueryTime must not be negative")
-        if self._prefix and self.collect and not self.enabled:
-            raise ApiSpecError(f"{self._prefix}.collect is enabled while {self._prefix}.enabled is not")
+        if self._prefix:
+            _check_collect_requires_enabled(self._prefix, self.collect, self.enabled)
 
     @property
     def enabled(self) -> Optional[bool]:
         return self._enabled
 
     def get_cm_data(self, logger: Logger) -> Dict[str, str]:
-        mycnf = f"""# Generated by MySQL Operator for Kubernetes
-[mysqld]
-slow_query_log={1 if self.enabled else 0}"""
-
-        if self.enabled:
-            mycnf += f"""
-slow_query_log_file='{self.fileName}'
-log_slow_admin_statements=1"""
-
-            if self.longQueryTime:
-                mycnf += f"""
-long_query_time={self.longQueryTime}"""
+        if self._cached_cm is None:
+            self._cached_cm = _render_slow_query_log_cnf(self.enabled, self.fileName, self.longQueryTime)
 
         return {
-            self.config_file_name : mycnf
+            self.config_file_name : self._cached_cm
         }
@@ -7,9 +7,11 @@ import pytest
 from typing import Dict, Callable, List, Any
 from logging import getLogger, Logger
 import copy
-from .controller.innodbcluster.logs.logs_types_api import GeneralLogSpec, ErrorLogSpec, SlowQueryLogSpec
+from .controller.innodbcluster.logs.logs_types_api import GeneralLogSpec, ErrorLogSpec, SlowQueryLogSpec, add_config_map_mounts_to_sts_spec
 from .controller.innodbcluster.logs.logs_api import LogsSpec, LogCollectorSpec, ServerLogType
 from .controller.innodbcluster.logs.logs_collector_fluentd_api import FluentdSpec, FluentdMysqlLogSpec, FluentdRecordAugmentationSpec
+from .controller.innodbcluster.cluster_objects import spec_to_dict
+from .controller.kubeutils import client as api_client
 from .controller.api_utils import ApiSpecError
 
 
@@ -528,6 +530,159 @@ log_error_services='log_sink_json'"""
     }}}}
 
 
+def test_log_spec_cm_data_reparse(general_log_factory: Callable[[], GeneralLogSpec],
+                                  general_log_spec_enabled_noncollected: Dict,
+                                  general_log_spec_nonenabled_noncollected: Dict,
+                                  logger: Logger) -> None:
+    prefix = ServerLogType.GENERAL.value
+    test_obj = general_log_factory()
+    test_obj.parse(general_log_spec_enabled_noncollected, prefix, logger)
+    cm = test_obj.get_cm_data(logger)
+    assert cm == test_obj.get_cm_data(logger)
+    assert cm["general-log.cnf"].endswith(f"general_log_file={test_obj.fileName}")
+
+    # the cached data must not survive a spec change
+    test_obj.parse(general_log_spec_nonenabled_noncollected, prefix, logger)
+    cm = test_obj.get_cm_data(logger)
+    assert cm == {
+        "general-log.cnf" : """# Generated by MySQL Operator for Kubernetes
+[mysqld]
+general_log=0"""
+    }
+
+
+def test_log_spec_validate_after_parse(logger: Logger) -> None:
+    prefix = ServerLogType.ERROR.value
+    test_obj = ErrorLogSpec()
+    test_obj.validate()
+
+    test_obj.parse({"verbosity": 5}, prefix, logger)
+    with pytest.raises(ApiSpecError, match=rf"{prefix}.verbosity must be between 1 and 3$"):
+        test_obj.validate()
+    # a failed validation must not be forgotten
+    with pytest.raises(ApiSpecError, match=rf"{prefix}.verbosity must be between 1 and 3$"):
+        test_obj.validate()
+
+    test_obj.parse({"verbosity": 2}, prefix, logger)
+    test_obj.validate()
+
+
+def test_log_spec_add_to_sts_spec_up_to_date(general_log_factory: Callable[[], GeneralLogSpec],
+                                             general_log_spec_enabled_noncollected: Dict,
+                                             logger: Logger) -> None:
+    prefix = ServerLogType.GENERAL.value
+    test_obj = general_log_factory()
+    test_obj.parse(general_log_spec_enabled_noncollected, prefix, logger)
+    sts = {"spec": {"template": {"spec" : { "containers": [{"name": "mysql"}], "volumes": []}}}}
+    container_name = "mysql"
+    cm_name = "ourcluster-logs-config"
+    test_obj.add_to_sts_spec(sts, None, container_name, cm_name, True, logger)
+    expected = copy.deepcopy(sts)
+    volumes = sts["spec"]["template"]["spec"]["volumes"]
+    volume_mounts = sts["spec"]["template"]["spec"]["containers"][0]["volumeMounts"]
+
+    # nothing to do, the STS must not be touched
+    test_obj.add_to_sts_spec(sts, None, container_name, cm_name, True, logger)
+    assert sts == expected
+    assert sts["spec"]["template"]["spec"]["volumes"] is volumes
+    assert sts["spec"]["template"]["spec"]["containers"][0]["volumeMounts"] is volume_mounts
+
+    # a different ConfigMap name must still be patched in
+    test_obj.add_to_sts_spec(sts, None, container_name, "othercluster-logs-config", True, logger)
+    assert sts["spec"]["template"]["spec"]["volumes"][0]["configMap"]["name"] == "othercluster-logs-config"
+
+    test_obj.add_to_sts_spec(sts, None, container_name, cm_name, False, logger)
+    assert sts == {"spec": {"template": {"spec" : { "containers": [{"name": "mysql", "volumeMounts": []}], "volumes": []}}}}
+
+
+def test_add_config_map_mounts_to_sts_spec(logger: Logger) -> None:
+    mounts = [GeneralLogSpec(), ErrorLogSpec(), SlowQueryLogSpec()]
+    container_name = "mysql"
+    cm_name = "ourcluster-logs-config"
+
+    # must be the same as patching every mount on its own
+    expected = {"spec": {"template": {"spec" : { "containers": [{"name": "mysql"}], "volumes": []}}}}
+    for mount in mounts:
+        mount.add_to_sts_spec(expected, None, container_name, cm_name, True, logger)
+
+    sts = {"spec": {"template": {"spec" : { "containers": [{"name": "mysql"}], "volumes": []}}}}
+    add_config_map_mounts_to_sts_spec(sts, None, mounts, container_name, cm_name, True, logger)
+    assert sts == expected
+    assert [volume["name"] for volume in sts["spec"]["template"]["spec"]["volumes"]] == [mount.volume_mount_name for mount in mounts]
+
+    add_config_map_mounts_to_sts_spec(sts, None, mounts, container_name, cm_name, True, logger)
+    assert sts == expected
+
+    add_config_map_mounts_to_sts_spec(sts, None, mounts, container_name, cm_name, False, logger)
+    assert sts == {"spec": {"template": {"spec" : { "containers": [{"name": "mysql", "volumeMounts": []}], "volumes": []}}}}
+
+
+# Stands in for InnoDBClusterObjectModifier, recording the patches instead of applying them
+class StsPatcherStub:
+    def __init__(self, sts: api_client.V1StatefulSet):
+        self.sts = sts
+        self.patches = []
+
+    def get_sts_path(self, path: str):
+        base = self.sts.spec
+        for path_element in path.split("/")[2:]:
+            base = base[path_element]
+        return base
+
+    def patch_sts(self, patch: dict) -> None:
+        self.patches.append(("patch_sts", patch))
+
+    def patch_sts_overwrite(self, patch: dict, patch_path: str) -> None:
+        self.patches.append(("patch_sts_overwrite", patch_path))
+
+
+def test_log_spec_add_to_sts_spec_v1_statefulset(logger: Logger) -> None:
+    mounts = [GeneralLogSpec(), ErrorLogSpec(), SlowQueryLogSpec()]
+    container_name = "mysql"
+    cm_name = "ourcluster-logs-config"
+
+    def v1_sts(mounted: list) -> api_client.V1StatefulSet:
+        container = api_client.V1Container(name=container_name, volume_mounts=[
+            api_client.V1VolumeMount(name=mount.volume_mount_name,
+                                     mount_path=f"{mount.config_file_mount_path}/{mount.config_file_name}",
+                                     sub_path=mount.config_file_name)
+            for mount in mounted
+        ])
+        volumes = [
+            api_client.V1Volume(name=mount.volume_mount_name,
+                                config_map=api_client.V1ConfigMapVolumeSource(name=cm_name, default_mode=0o644, items=[
+                                    api_client.V1KeyToPath(key=mount.config_file_name, path=mount.config_file_name)
+                                ]))
+            for mount in mounted
+        ]
+        sts = api_client.V1StatefulSet(spec=api_client.V1StatefulSetSpec(
+            selector=api_client.V1LabelSelector(),
+            service_name="ourcluster-instances",
+            template=api_client.V1PodTemplateSpec(spec=api_client.V1PodSpec(containers=[container], volumes=volumes))))
+        # like InnoDBClusterObjectModifier does with the STS fetched from the server
+        sts.spec = spec_to_dict(sts.spec)
+        return sts
+
+    # already mounted, nothing must be patched
+    sts = v1_sts(mounts)
+    expected = copy.deepcopy(sts.spec)
+    patcher = StsPatcherStub(sts)
+    for mount in mounts:
+        mount.add_to_sts_spec(sts, patcher, container_name, cm_name, True, logger)
+    add_config_map_mounts_to_sts_spec(sts, patcher, mounts, container_name, cm_name, True, logger)
+    assert patcher.patches == []
+    assert sts.spec == expected
+
+    # the mount of the slow query log is missing, thus it has to be patched in
+    sts = v1_sts(mounts[:2])
+    patcher = StsPatcherStub(sts)
+    add_config_map_mounts_to_sts_spec(sts, patcher, mounts, container_name, cm_name, True, logger)
+    # the container exists, thus its volume mounts are set in place and only the volume is patched in
+    assert patcher.patches == [("patch_sts", {"spec": {"template": {"spec": {"volumes": [mounts[2]._get_volume(cm_name)]}}}})]
+    volume_mounts = sts.spec["template"]["spec"]["containers"][0]["volumeMounts"]
+    assert [volume_mount["name"] for volume_mount in volume_mounts] == [mount.volume_mount_name for mount in mounts]
+
+
 @pytest.fixture
 def logs_spec1(general_log_spec_enabled_noncollected, slow_query_log_spec_enabled_noncollected, error_log_spec_collected) -> Dict:
     return {